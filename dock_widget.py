@@ -9,7 +9,9 @@ from qgis.PyQt.QtWidgets import (
     QDoubleSpinBox,
     QCheckBox,
 )
-from qgis.PyQt.QtCore import Qt, pyqtSignal
+from qgis.PyQt.QtCore import Qt, QSignalBlocker, QTimer, pyqtSignal
+
+RADIUS_EMIT_DELAY_MS = 50  # Coalescing window for radius spinbox changes
 
 
 class SelectOnHoverPanel(QWidget):
@@ -32,6 +34,12 @@ class SelectOnHoverPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+
+        # Coalesce bursts of spinbox/unit changes into one radiusChanged emission
+        self._radius_emit_timer = QTimer(self)
+        self._radius_emit_timer.setSingleShot(True)
+        self._radius_emit_timer.timeout.connect(self._really_emit_radius)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -83,6 +91,7 @@ class SelectOnHoverPanel(QWidget):
         self.restrict_combo.addItem("Visible & selectable layers", "visible")
         self.restrict_combo.addItem("All selectable layers", "all")
         self.restrict_combo.addItem("Active layer only", "active")
+        self._restrict_data_to_idx = self._combo_data_to_index(self.restrict_combo)
         self.restrict_combo.currentIndexChanged.connect(self._on_options_changed)
         layout.addWidget(self.restrict_combo)
 
@@ -93,6 +102,7 @@ class SelectOnHoverPanel(QWidget):
         self.selection_mode_combo.addItem("Add to selection", "add")
         self.selection_mode_combo.addItem("Replace selection", "replace")
         self.selection_mode_combo.addItem("Toggle selection", "toggle")
+        self._selection_data_to_idx = self._combo_data_to_index(self.selection_mode_combo)
         self.selection_mode_combo.currentIndexChanged.connect(self._on_options_changed)
         layout.addWidget(self.selection_mode_combo)
 
@@ -155,38 +165,59 @@ class SelectOnHoverPanel(QWidget):
     # Public method to programmatically set values (used when loading settings)
     def setValues(self, pixel_radius=20, mapunit_radius=10.0, unit_mode="pixels", 
                   restrict_mode="visible", selection_mode="add", show_rubber_band=True):
-        """Set all control values (used when loading settings)"""
-        self.spin_pixels.setValue(int(pixel_radius))
-        self.spin_mapunits.setValue(float(mapunit_radius))
-        
-        # Set unit mode
-        if unit_mode == "map_units":
-            self.units_combo.setCurrentIndex(1)
-        else:
-            self.units_combo.setCurrentIndex(0)
-
-        # Set restrict mode
-        idx = 0
-        for i in range(self.restrict_combo.count()):
-            if self.restrict_combo.itemData(i) == restrict_mode:
-                idx = i
-                break
-        self.restrict_combo.setCurrentIndex(idx)
-
-        # Set selection mode
-        idx = 0
-        for i in range(self.selection_mode_combo.count()):
-            if self.selection_mode_combo.itemData(i) == selection_mode:
-                idx = i
-                break
-        self.selection_mode_combo.setCurrentIndex(idx)
-
-        # Set visual feedback
-        self.show_rubber_band_cb.setChecked(show_rubber_band)
+        """
+        Set all control values (used when loading settings). Widget signals are
+        blocked during the update and each panel signal is emitted once at the end.
+        """
+        blockers = [
+            QSignalBlocker(widget)
+            for widget in (
+                self.spin_pixels,
+                self.spin_mapunits,
+                self.units_combo,
+                self.restrict_combo,
+                self.selection_mode_combo,
+                self.show_rubber_band_cb,
+            )
+        ]
+        try:
+            self.spin_pixels.setValue(int(pixel_radius))
+            self.spin_mapunits.setValue(float(mapunit_radius))
+            
+            # Set unit mode
+            if unit_mode == "map_units":
+                self.units_combo.setCurrentIndex(1)
+            else:
+                self.units_combo.setCurrentIndex(0)
+
+            # Set restrict mode
+            self.restrict_combo.setCurrentIndex(self._restrict_data_to_idx.get(restrict_mode, 0))
+
+            # Set selection mode
+            self.selection_mode_combo.setCurrentIndex(
+                self._selection_data_to_idx.get(selection_mode, 0)
+            )
+
+            # Set visual feedback
+            self.show_rubber_band_cb.setChecked(show_rubber_band)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
         
         self._apply_units_ui()
 
+        # Emit now and drop any pending debounced emit carrying older values
+        self._radius_emit_timer.stop()
+        self._really_emit_radius()
+        self.optionsChanged.emit(self.restrict_mode, self.selection_mode)
+        self.visualFeedbackChanged.emit(self.show_rubber_band)
+
     # Internal callbacks
+    @staticmethod
+    def _combo_data_to_index(combo) -> dict:
+        """Map each item's userData to its index in the combo box"""
+        return {combo.itemData(i): i for i in range(combo.count())}
+
     def _on_units_changed(self, i):
         self._apply_units_ui()
         self._emit_radius_changed()
@@ -219,4 +250,7 @@ class SelectOnHoverPanel(QWidget):
         self.clearSelectionRequested.emit()
 
     def _emit_radius_changed(self):
+        self._radius_emit_timer.start(RADIUS_EMIT_DELAY_MS)
+
+    def _really_emit_radius(self):
         self.radiusChanged.emit(self.pixel_radius, self.mapunit_radius, self.unit_mode)
@@ -1,8 +1,13 @@
+import math
+from collections import OrderedDict
+
+import numpy as np
 from qgis.PyQt.QtCore import Qt, QPoint, QTimer, pyqtSignal
 from qgis.PyQt.QtGui import QPixmap, QPainter, QColor, QPen, QCursor
 from qgis.core import (
     QgsMapLayer,
     QgsGeometry,
+    QgsFeature,
     QgsPointXY,
     QgsFeatureRequest,
     QgsProject,
@@ -16,7 +21,12 @@ from qgis.gui import QgsMapTool, QgsRubberBand
 
 # Constants
 DEFAULT_CIRCLE_SEGMENTS = 32
+MIN_CIRCLE_SEGMENTS = 2  # Per quarter circle, i.e. an 8-sided polygon
 DEFAULT_HOVER_DELAY_MS = 15  # Reduced from 50ms for more responsive selection
+EXTENTS_CURSOR_DELAY_MS = 50  # Coalescing window for cursor updates during pan/zoom
+CURSOR_CACHE_SIZE = 64  # Max number of distinct cursor radii kept in memory
+MAX_INDEXED_LAYERS = 32  # LRU cap on lazily built per-layer spatial indexes
+NUMPY_SELECTION_THRESHOLD = 1024  # Existing selection size above which NumPy set ops are used
 
 
 class MapToolSelectCircle(QgsMapTool):
@@ -31,17 +41,18 @@ class MapToolSelectCircle(QgsMapTool):
     - Visual cursor that represents the circle
     - Optional rubber band showing selection area
     - Debounced hover to improve performance
-    - Automatic index rebuilding on layer changes
+    - Incremental index updates on layer and feature changes
     """
 
-    # Signal emitted when rebuild completes
+    # Signal emitted when indexes are reset (they are rebuilt lazily on hover)
     indexesRebuilt = pyqtSignal()
     # Signal emitted with selection count
     selectionComplete = pyqtSignal(int)  # number of features selected
 
     def __init__(self, canvas, radius_pixels=20, radius_map_units=10.0, 
                  unit_mode="pixels", circle_segments=DEFAULT_CIRCLE_SEGMENTS, 
-                 restrict_mode="visible", selection_mode="add", show_rubber_band=True):
+                 restrict_mode="visible", selection_mode="add", show_rubber_band=True,
+                 debug=False):
         """
         Initialize the map tool.
         
@@ -50,10 +61,12 @@ class MapToolSelectCircle(QgsMapTool):
             radius_pixels: Radius in screen pixels
             radius_map_units: Radius in map units
             unit_mode: "pixels" or "map_units"
-            circle_segments: Number of segments to approximate circle
+            circle_segments: Maximum number of segments per quarter circle; fewer are
+                used for small on-screen radii
             restrict_mode: "all" (all selectable), "visible" (visible & selectable), "active" (active layer)
             selection_mode: "add" (union), "replace" (clear then select), "toggle" (xor)
             show_rubber_band: Whether to show visual feedback circle on map
+            debug: Whether to write informational messages to the QGIS log
         """
         super().__init__(canvas)
         self.canvas = canvas
@@ -64,13 +77,20 @@ class MapToolSelectCircle(QgsMapTool):
         self.restrict_mode = restrict_mode
         self.selection_mode = selection_mode
         self.show_rubber_band = show_rubber_band
+        self._debug = bool(debug)  # Info logging only; warnings are always logged
         
         # Set initial cursor
+        self._cursor_cache = OrderedDict()  # radius -> QCursor, LRU ordered
         self.setCursor(self._cursor_for_radius(self.radius_pixels))
         
         # Spatial indexes cache
-        self.layer_indexes = {}  # layer.id() -> QgsSpatialIndex
+        self.layer_indexes = OrderedDict()  # layer.id() -> QgsSpatialIndex, LRU ordered
         self.indexed_layer_ids = set()
+        self._index_failed_ids = set()  # layers whose index build failed; not retried
+        # layer.id() -> (sorted feature ids, (N, 4) array of xmin/ymin/xmax/ymax)
+        self.layer_bboxes = {}
+        # layer.id() -> [(signal, slot), ...] keeping indexes in sync with edits
+        self._layer_connections = {}
 
         # Rubber band for visual feedback
         self.rubber_band = QgsRubberBand(canvas, QgsWkbTypes.PolygonGeometry)
@@ -79,6 +99,8 @@ class MapToolSelectCircle(QgsMapTool):
         self.rubber_band.setLineStyle(Qt.DashLine)
         if not self.show_rubber_band:
             self.rubber_band.hide()
+        # (center, radius, segments, crs) the rubber band polygon was last built for
+        self._rubber_anchor = None
 
         # Debouncing: delay selection to avoid excessive processing on every mouse move
         self._hover_timer = QTimer()
@@ -86,16 +108,40 @@ class MapToolSelectCircle(QgsMapTool):
         self._hover_timer.timeout.connect(self._do_selection)
         self._hover_delay_ms = DEFAULT_HOVER_DELAY_MS
         self._pending_pos = None
-
-        # Update cursor when canvas extents change (useful if unit_mode == "map_units")
-        self.canvas.extentsChanged.connect(self._on_canvas_extents_changed)
-
-        # Connect to project signals for automatic index rebuilding
+        # Position/extent of the last processed tick, to skip sub-pixel wiggles
+        self._last_processed_pos = None
+        self._last_processed_extent = None
+
+        # Last hovered feature ids per layer, to skip re-selecting an unchanged hit set
+        self._last_hover_ids = {}  # layer.id() -> frozenset of feature ids
+        # layer.id() -> (signal, slot) dropping the cached hit set on outside selection changes
+        self._selection_connections = {}
+        self._applying_selection = False  # True while our own selectByIds runs
+
+        # Project -> layer CRS transforms, reused across hover ticks
+        self._xform_cache = {}  # layer.id() -> QgsCoordinateTransform
+
+        # Vector layers matching the restrict mode; None until (re)collected
+        self._active_layers = None
+
+        # Update cursor when canvas extents change (useful if unit_mode == "map_units"),
+        # coalesced so a pan/zoom gesture rebuilds the cursor once
+        self._extents_timer = QTimer()
+        self._extents_timer.setSingleShot(True)
+        self._extents_timer.timeout.connect(self._apply_cursor_from_extents)
+        self._connect_unique(self.canvas.extentsChanged, self._on_canvas_extents_changed)
+
+        # Layer additions/removals are forwarded by the owner through
+        # addLayerIndex()/removeLayerIndex()
         project = QgsProject.instance()
-        project.layersAdded.connect(self._on_layers_changed)
-        project.layersRemoved.connect(self._on_layers_changed)
-        # Note: For visibility changes, ideally connect to layerTreeRoot signals,
-        # but that requires more complex setup. User can manually rebuild if needed.
+        self._connect_unique(project.crsChanged, self._on_project_crs_changed)
+
+        # Layer tree and active layer changes invalidate the cached layer list
+        root = project.layerTreeRoot()
+        self._connect_unique(root.visibilityChanged, self._invalidate_layer_list)
+        self._connect_unique(root.addedChildren, self._invalidate_layer_list)
+        self._connect_unique(root.removedChildren, self._invalidate_layer_list)
+        self._connect_unique(self.canvas.currentLayerChanged, self._invalidate_layer_list)
 
     # Public API
     def setRadius(self, pixel_radius: int = None, mapunit_radius: float = None, 
@@ -108,6 +154,7 @@ class MapToolSelectCircle(QgsMapTool):
         if unit_mode is not None:
             if unit_mode in ("pixels", "map_units"):
                 self.unit_mode = unit_mode
+        self._last_processed_pos = None
         # Update cursor size
         pix_radius = self._compute_pixel_radius_for_cursor()
         self.setCursor(self._cursor_for_radius(pix_radius))
@@ -116,11 +163,21 @@ class MapToolSelectCircle(QgsMapTool):
         """Update restrict mode (all/visible/active)"""
         if restrict_mode in ("all", "visible", "active"):
             self.restrict_mode = restrict_mode
+            self._last_hover_ids.clear()
+            self._last_processed_pos = None
+            self._active_layers = None
 
     def setSelectionMode(self, selection_mode: str):
         """Update selection mode (add/replace/toggle)"""
         if selection_mode in ("add", "replace", "toggle"):
             self.selection_mode = selection_mode
+            self._last_hover_ids.clear()
+            self._last_processed_pos = None
+
+    def setOptions(self, restrict_mode: str, selection_mode: str):
+        """Update restrict and selection modes together; per-layer indexes are kept"""
+        self.setRestrictMode(restrict_mode)
+        self.setSelectionMode(selection_mode)
 
     def setShowRubberBand(self, show: bool):
         """Toggle rubber band visibility"""
@@ -132,27 +189,259 @@ class MapToolSelectCircle(QgsMapTool):
 
     def rebuildIndexes(self):
         """
-        (Re)build spatial indexes for layers that match current restriction.
+        Discard spatial indexes so they are rebuilt for layers matching the current
+        restriction. Indexes are built lazily, the first time a layer is hovered.
         This is called on activation and when the user requests rebuild.
         """
+        for layer_id in list(self._layer_connections):
+            self._disconnect_layer_signals(layer_id)
         self.layer_indexes.clear()
         self.indexed_layer_ids.clear()
+        self.layer_bboxes.clear()
+        self._index_failed_ids.clear()
+
+        self._active_layers = None
+
+        # Emit signal
+        try:
+            self.indexesRebuilt.emit()
+        except Exception:
+            pass
+
+    def addLayerIndex(self, layer):
+        """
+        Register a layer added to the project. Other layers keep their indexes;
+        the new layer's index is built on first hover if it is eligible.
+        """
+        self.removeLayerIndex(layer.id())
+        self._active_layers = None
+        if self._debug:
+            QgsMessageLog.logMessage(
+                f"Layer added, will index on first hover: {layer.name()}", 
+                "SelectOnHover", 
+                Qgis.Info
+            )
+
+    def removeLayerIndex(self, layer_id: str):
+        """Drop the index and all cached state of a layer removed from the project"""
+        self._xform_cache.pop(layer_id, None)
+        self._last_hover_ids.pop(layer_id, None)
+        self._unwatch_selection(layer_id)
+        self._disconnect_layer_signals(layer_id)
+        self.layer_indexes.pop(layer_id, None)
+        self.indexed_layer_ids.discard(layer_id)
+        self._index_failed_ids.discard(layer_id)
+        self.layer_bboxes.pop(layer_id, None)
+        self._active_layers = None
 
+    # Internal helpers
+    @staticmethod
+    def _connect_unique(signal, slot):
+        """Connect signal to slot unless that exact connection already exists"""
+        try:
+            signal.connect(slot, Qt.UniqueConnection)
+        except TypeError:
+            # Raised by PyQt when the connection is already in place
+            pass
+
+    def _build_layer_index(self, layer) -> bool:
+        """Build the spatial index and bbox arrays for one layer. Returns False on failure."""
+        try:
+            index = QgsSpatialIndex(QgsSpatialIndex.FlagStoreFeatureGeometries)
+            ids = []
+            coords = []
+            # Single provider scan feeds both the index and the bbox arrays
+            request = QgsFeatureRequest().setNoAttributes()
+            for feat in layer.getFeatures(request):
+                g = feat.geometry()
+                if g is None or g.isNull():
+                    continue
+                index.addFeature(feat)
+                rect = g.boundingBox()
+                ids.append(feat.id())
+                coords.extend((rect.xMinimum(), rect.yMinimum(),
+                               rect.xMaximum(), rect.yMaximum()))
+            self.layer_indexes[layer.id()] = index
+            self.indexed_layer_ids.add(layer.id())
+            self.layer_bboxes[layer.id()] = self._build_bbox_arrays(ids, coords)
+            if self._debug:
+                QgsMessageLog.logMessage(
+                    f"Built spatial index for layer: {layer.name()}", 
+                    "SelectOnHover", 
+                    Qgis.Info
+                )
+            return True
+        except Exception as e:
+            # If indexing fails, skip layer; we will fall back to bbox filter
+            QgsMessageLog.logMessage(
+                f"Failed to build index for layer {layer.name()}: {str(e)}", 
+                "SelectOnHover", 
+                Qgis.Warning
+            )
+            return False
+
+    def _ensure_index(self, layer):
+        """Return the layer's spatial index, building it on first use (None if it cannot be built)"""
+        layer_id = layer.id()
+        index = self.layer_indexes.get(layer_id)
+        if index is not None:
+            self.layer_indexes.move_to_end(layer_id)
+            return index
+        if layer_id in self._index_failed_ids:
+            return None
+
+        if not self._build_layer_index(layer):
+            self._index_failed_ids.add(layer_id)
+            return None
+        self._connect_layer_signals(layer)
+
+        # Evict least recently hovered layers to bound memory
+        while len(self.layer_indexes) > MAX_INDEXED_LAYERS:
+            old_id, _ = self.layer_indexes.popitem(last=False)
+            self.indexed_layer_ids.discard(old_id)
+            self.layer_bboxes.pop(old_id, None)
+            self._disconnect_layer_signals(old_id)
+        return self.layer_indexes[layer_id]
+
+    def _connect_layer_signals(self, layer):
+        """Keep the layer's index up to date with feature edits and data source changes"""
+        connections = [
+            (layer.featureAdded, lambda fid, l=layer: self._on_feature_added(l, fid)),
+            (layer.featureDeleted, lambda fid, l=layer: self._on_feature_deleted(l, fid)),
+            (layer.geometryChanged,
+             lambda fid, geom, l=layer: self._on_geometry_changed(l, fid, geom)),
+            # Committing assigns new ids to added features, so reindex the layer
+            (layer.afterCommitChanges, lambda l=layer: self._on_layer_committed(l)),
+            # A new filter, a reload or direct provider writes change the feature set
+            # wholesale, so drop the index and let the next hover rebuild it
+            (layer.subsetStringChanged, lambda lid=layer.id(): self.removeLayerIndex(lid)),
+        ]
+        provider = layer.dataProvider()
+        if provider is not None:
+            connections.append(
+                (provider.dataChanged, lambda lid=layer.id(): self.removeLayerIndex(lid))
+            )
+        for signal, slot in connections:
+            signal.connect(slot)
+        self._layer_connections[layer.id()] = connections
+
+    def _disconnect_layer_signals(self, layer_id):
+        """Disconnect edit tracking for a layer"""
+        for signal, slot in self._layer_connections.pop(layer_id, []):
+            try:
+                signal.disconnect(slot)
+            except Exception:
+                pass
+
+    def _watch_selection(self, layer):
+        """Forget the layer's cached hit set when its selection changes outside this tool"""
+        if layer.id() in self._selection_connections:
+            return
+        slot = lambda *args, lid=layer.id(): self._on_layer_selection_changed(lid)
+        layer.selectionChanged.connect(slot)
+        self._selection_connections[layer.id()] = (layer.selectionChanged, slot)
+
+    def _unwatch_selection(self, layer_id):
+        """Disconnect selection tracking for a layer"""
+        signal, slot = self._selection_connections.pop(layer_id, (None, None))
+        if signal is None:
+            return
+        try:
+            signal.disconnect(slot)
+        except Exception:
+            pass
+
+    def _on_layer_selection_changed(self, layer_id):
+        """Re-apply the hover selection on next tick, e.g. after Deselect All"""
+        if not self._applying_selection:
+            self._last_hover_ids.pop(layer_id, None)
+
+    def _index_feature(self, fid, geometry):
+        """Wrap an id and geometry in a QgsFeature for QgsSpatialIndex add/delete"""
+        feat = QgsFeature(fid)
+        feat.setGeometry(geometry)
+        return feat
+
+    def _remove_from_index(self, index, fid):
+        """Remove a feature using the geometry stored in the index, which the layer may no longer have"""
+        old_geom = index.geometry(fid)
+        if old_geom is not None and not old_geom.isNull():
+            index.deleteFeature(self._index_feature(fid, old_geom))
+
+    def _on_feature_added(self, layer, fid):
+        """Insert a newly added feature into the layer's index"""
+        try:
+            index = self.layer_indexes.get(layer.id())
+            if index is None:
+                return
+            feat = layer.getFeature(fid)
+            if feat.hasGeometry():
+                index.addFeature(feat)
+            self._last_hover_ids.pop(layer.id(), None)
+        except Exception:
+            pass
+
+    def _on_feature_deleted(self, layer, fid):
+        """Remove a deleted feature from the layer's index"""
+        try:
+            index = self.layer_indexes.get(layer.id())
+            if index is None:
+                return
+            self._remove_from_index(index, fid)
+            self._last_hover_ids.pop(layer.id(), None)
+        except Exception:
+            pass
+
+    def _on_geometry_changed(self, layer, fid, geometry):
+        """Replace a feature's entry in the layer's index and bbox arrays"""
+        try:
+            index = self.layer_indexes.get(layer.id())
+            if index is None:
+                return
+            self._remove_from_index(index, fid)
+            if geometry is not None and not geometry.isNull():
+                index.addFeature(self._index_feature(fid, geometry))
+
+                # Keep the culling bbox in step; unknown ids are never culled
+                entry = self.layer_bboxes.get(layer.id())
+                if entry is not None and entry[0].size:
+                    ids, boxes = entry
+                    row = min(int(np.searchsorted(ids, fid)), ids.size - 1)
+                    if ids[row] == fid:
+                        rect = geometry.boundingBox()
+                        boxes[row] = (rect.xMinimum(), rect.yMinimum(),
+                                      rect.xMaximum(), rect.yMaximum())
+            self._last_hover_ids.pop(layer.id(), None)
+        except Exception:
+            pass
+
+    def _on_layer_committed(self, layer):
+        """Rebuild one layer's index after its edits are committed"""
+        try:
+            if layer.id() in self.layer_indexes:
+                self._build_layer_index(layer)
+                self._last_hover_ids.pop(layer.id(), None)
+        except Exception:
+            pass
+
+    def _eligible_layers(self) -> list:
+        """Return the cached list of vector layers for the current restrict mode"""
+        if self._active_layers is None:
+            self._active_layers = self._collect_layers()
+        return self._active_layers
+
+    def _collect_layers(self) -> list:
+        """Walk the project and collect vector layers matching the restrict mode"""
         project = QgsProject.instance()
         root = project.layerTreeRoot()
+        layers = []
 
         for layer in project.mapLayers().values():
             if layer.type() != QgsMapLayer.VectorLayer:
                 continue
-            
-            # Respect selectable flag
-            try:
-                if not layer.selectable():
-                    continue
-            except Exception:
-                pass
 
-            # Restriction handling
+            # Restriction handling; the selectable flag is checked per tick since
+            # it changes without a signal that would invalidate this list
             if self.restrict_mode == "visible":
                 node = root.findLayer(layer.id())
                 if node is None or not node.isVisible():
@@ -162,32 +451,44 @@ class MapToolSelectCircle(QgsMapTool):
                 if active is None or active.id() != layer.id():
                     continue
 
-            # Build spatial index for this layer
-            try:
-                index = QgsSpatialIndex(layer.getFeatures())
-                self.layer_indexes[layer.id()] = index
-                self.indexed_layer_ids.add(layer.id())
-                QgsMessageLog.logMessage(
-                    f"Built spatial index for layer: {layer.name()}", 
-                    "SelectOnHover", 
-                    Qgis.Info
-                )
-            except Exception as e:
-                # If indexing fails, skip layer; we will fall back to bbox filter
-                QgsMessageLog.logMessage(
-                    f"Failed to build index for layer {layer.name()}: {str(e)}", 
-                    "SelectOnHover", 
-                    Qgis.Warning
-                )
-                continue
+            layers.append(layer)
 
-        # Emit signal
-        try:
-            self.indexesRebuilt.emit()
-        except Exception:
-            pass
+        return layers
+
+    def _invalidate_layer_list(self, *args):
+        """Force the eligible layer list to be collected again on next use"""
+        self._active_layers = None
+
+    @staticmethod
+    def _build_bbox_arrays(ids, coords):
+        """Turn collected feature ids and flat xmin/ymin/xmax/ymax values into NumPy arrays sorted by id"""
+        boxes = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        ids = np.asarray(ids, dtype=np.int64)
+        order = np.argsort(ids)
+        return ids[order], boxes[order]
+
+    def _cull_candidates(self, layer_id, candidate_ids, cx, cy, radius):
+        """
+        Drop index candidates whose bounding box does not reach the circle.
+        Ids not present in the bbox arrays are kept for the exact test.
+        """
+        entry = self.layer_bboxes.get(layer_id)
+        if entry is None or not candidate_ids:
+            return candidate_ids
+        ids, boxes = entry
+        if ids.size == 0:
+            return candidate_ids
+
+        cand = np.asarray(candidate_ids, dtype=np.int64)
+        rows = np.minimum(np.searchsorted(ids, cand), ids.size - 1)
+        known = ids[rows] == cand
+        b = boxes[rows]
+        # Distance from the circle center to the closest point of each bbox
+        dx = np.maximum(np.maximum(b[:, 0] - cx, cx - b[:, 2]), 0.0)
+        dy = np.maximum(np.maximum(b[:, 1] - cy, cy - b[:, 3]), 0.0)
+        keep = ~known | (dx * dx + dy * dy <= radius * radius)
+        return cand[keep].tolist()
 
-    # Internal helpers
     def _compute_pixel_radius_for_cursor(self) -> int:
         """Compute pixel radius to draw the cursor. If unit_mode is map_units, convert to pixels."""
         if self.unit_mode == "pixels":
@@ -201,6 +502,11 @@ class MapToolSelectCircle(QgsMapTool):
 
     def _cursor_for_radius(self, radius: int) -> QCursor:
         """Build a custom cursor showing a circle of the given radius"""
+        cursor = self._cursor_cache.get(radius)
+        if cursor is not None:
+            self._cursor_cache.move_to_end(radius)
+            return cursor
+
         size = max(16, radius * 2 + 8)
         pix = QPixmap(size, size)
         pix.fill(Qt.transparent)
@@ -216,29 +522,86 @@ class MapToolSelectCircle(QgsMapTool):
         painter.drawLine(center.x(), center.y() - 4, center.x(), center.y() + 4)
         painter.end()
         cursor = QCursor(pix, hotX=size // 2, hotY=size // 2)
+
+        self._cursor_cache[radius] = cursor
+        if len(self._cursor_cache) > CURSOR_CACHE_SIZE:
+            self._cursor_cache.popitem(last=False)
         return cursor
 
     def _on_canvas_extents_changed(self):
-        """Update cursor when extents change (for map-unit mode)"""
+        """Schedule a cursor update when extents change (for map-unit mode)"""
+        if not self._extents_timer.isActive():
+            self._extents_timer.start(EXTENTS_CURSOR_DELAY_MS)
+
+    def _apply_cursor_from_extents(self):
+        """Update cursor to match the current map scale"""
         pix_radius = self._compute_pixel_radius_for_cursor()
         self.setCursor(self._cursor_for_radius(pix_radius))
 
-    def _on_layers_changed(self):
-        """Auto-rebuild indexes when layers are added/removed"""
-        if self.canvas.mapTool() == self:
-            QgsMessageLog.logMessage(
-                "Layers changed, rebuilding indexes...", 
-                "SelectOnHover", 
-                Qgis.Info
+    def _on_project_crs_changed(self):
+        """Invalidate cached transforms when the project CRS changes"""
+        self._xform_cache.clear()
+
+    def _segments_for_pixel_radius(self, pixel_radius: int) -> int:
+        """
+        Number of segments per quarter circle keeping the polygon within half a
+        pixel of the true circle, clamped to [MIN_CIRCLE_SEGMENTS, circle_segments].
+        """
+        if pixel_radius <= 0.5:
+            return MIN_CIRCLE_SEGMENTS
+        total = math.pi / math.acos(1.0 - 0.5 / pixel_radius)
+        return max(MIN_CIRCLE_SEGMENTS, min(self.circle_segments, int(math.ceil(total / 4))))
+
+    def _update_rubber_band(self, center, radius, segments, circle_geom, crs):
+        """
+        Move the rubber band to the circle around center. The polygon is only
+        rebuilt when radius, segment count or CRS change; otherwise the
+        existing ring is shifted.
+        """
+        anchor = self._rubber_anchor
+        if anchor is not None and anchor[1:] == (radius, segments, crs):
+            anchor_center = anchor[0]
+            self.rubber_band.setTranslationOffset(
+                center.x() - anchor_center.x(), center.y() - anchor_center.y()
             )
-            self.rebuildIndexes()
+            return
+
+        self.rubber_band.setTranslationOffset(0, 0)
+        self.rubber_band.setToGeometry(circle_geom, crs)
+        self._rubber_anchor = (QgsPointXY(center), radius, segments, crs)
+
+    def _combine_selection(self, current_sel, ids_to_process) -> list:
+        """
+        Combine the layer's current selection with the hovered ids according to
+        the selection mode. Large selections use sorted NumPy set operations.
+        """
+        if self.selection_mode == "replace":
+            # Replace: use only new selection
+            return list(ids_to_process)
+
+        if len(current_sel) < NUMPY_SELECTION_THRESHOLD:
+            current_sel = set(current_sel)
+            if self.selection_mode == "toggle":
+                # Toggle: XOR
+                return list(current_sel.symmetric_difference(ids_to_process))
+            # Add (default): union with existing selection
+            return list(current_sel.union(ids_to_process))
+
+        current = np.fromiter(current_sel, dtype=np.int64, count=len(current_sel))
+        hits = np.fromiter(ids_to_process, dtype=np.int64, count=len(ids_to_process))
+        if self.selection_mode == "toggle":
+            return np.setxor1d(current, hits).tolist()
+        return np.union1d(current, hits).tolist()
 
     def canvasMoveEvent(self, event):
         """
-        Called whenever mouse moves. Debounced to avoid excessive processing.
+        Called whenever mouse moves. Throttled to avoid excessive processing:
+        the first move schedules a tick, later moves only update the position,
+        so a selection runs at most once per hover delay even during fast drags.
         """
         self._pending_pos = event.pos()
-        self._hover_timer.start(self._hover_delay_ms)
+        if not self._hover_timer.isActive():
+            self._hover_timer.start(self._hover_delay_ms)
 
     def _do_selection(self):
         """
@@ -248,6 +611,17 @@ class MapToolSelectCircle(QgsMapTool):
         if self._pending_pos is None:
             return
 
+        # Skip micro-movements: same map view and pointer moved less than 2 pixels
+        extent = self.canvas.extent()
+        if (
+            self._last_processed_pos is not None
+            and extent == self._last_processed_extent
+            and (self._pending_pos - self._last_processed_pos).manhattanLength() < 2
+        ):
+            return
+        self._last_processed_pos = QPoint(self._pending_pos)
+        self._last_processed_extent = extent
+
         # Center point in map (project) coordinates
         center_map_pt = self.toMapCoordinates(self._pending_pos)
 
@@ -258,122 +632,169 @@ class MapToolSelectCircle(QgsMapTool):
         else:
             radius_map_units = float(self.radius_map_units)
 
+        # Fewer vertices for small on-screen circles
+        segments = self._segments_for_pixel_radius(self._compute_pixel_radius_for_cursor())
+
         # Create circular geometry in project/map coordinates
         circle_geom = QgsGeometry.fromPointXY(QgsPointXY(center_map_pt)).buffer(
-            radius_map_units, self.circle_segments
+            radius_map_units, segments
         )
 
-        # Update rubber band
-        if self.show_rubber_band:
-            project = QgsProject.instance()
-            proj_crs = project.crs()
-            self.rubber_band.setToGeometry(circle_geom, proj_crs)
-
         project = QgsProject.instance()
         proj_crs = project.crs()
-        root = project.layerTreeRoot()
+
+        # Update rubber band
+        if self.show_rubber_band:
+            self._update_rubber_band(
+                center_map_pt, radius_map_units, segments, circle_geom, proj_crs
+            )
 
         total_selected = 0
 
-        # Iterate through layers
-        for layer in project.mapLayers().values():
-            if layer.type() != QgsMapLayer.VectorLayer:
-                continue
-            
-            # Respect selectable flag
-            try:
-                if not layer.selectable():
-                    continue
-            except Exception:
-                pass
+        selection_changed = False
 
-            # Restriction handling
-            if self.restrict_mode == "visible":
-                node = root.findLayer(layer.id())
-                if node is None or not node.isVisible():
-                    continue
-            elif self.restrict_mode == "active":
-                active = self.canvas.currentLayer()
-                if active is None or active.id() != layer.id():
-                    continue
+        # Freeze the canvas while selections are applied so that the per-layer
+        # selectionChanged repaints collapse into a single refresh afterwards;
+        # a freeze set by someone else (e.g. project loading) is left in place
+        was_frozen = self.canvas.isFrozen()
+        self.canvas.freeze(True)
+        try:
+            # Iterate through the cached eligible layers
+            for layer in self._eligible_layers():
+                # Selectable flag may change without a layer tree signal
+                try:
+                    if not layer.selectable():
+                        continue
+                except Exception:
+                    pass
 
-            layer_crs = layer.crs()
-            geom_for_layer = circle_geom
+                layer_crs = layer.crs()
+                geom_for_layer = circle_geom
+                # True circle center/radius in layer CRS, None when it is distorted
+                circle_center = QgsPointXY(center_map_pt)
+                circle_radius = radius_map_units
             
-            # Transform to layer CRS if needed
-            if layer_crs != proj_crs:
-                try:
-                    xform = QgsCoordinateTransform(proj_crs, layer_crs, project)
-                    geom_for_layer = QgsGeometry(circle_geom)  # clone
-                    geom_for_layer.transform(xform)
-                except Exception as e:
-                    QgsMessageLog.logMessage(
-                        f"CRS transform failed for layer {layer.name()}: {str(e)}", 
-                        "SelectOnHover", 
-                        Qgis.Warning
-                    )
+                # Transform to layer CRS if needed
+                if layer_crs != proj_crs:
+                    try:
+                        xform = self._xform_cache.get(layer.id())
+                        if xform is None or xform.destinationCrs() != layer_crs:
+                            xform = QgsCoordinateTransform(proj_crs, layer_crs, project)
+                            self._xform_cache[layer.id()] = xform
+                        if proj_crs.mapUnits() == layer_crs.mapUnits():
+                            # Same units: transform only the center and one radius
+                            # point, then buffer locally instead of reprojecting every vertex
+                            center_pt = QgsPointXY(center_map_pt)
+                            center_layer = xform.transform(center_pt)
+                            edge_layer = xform.transform(
+                                QgsPointXY(center_pt.x() + radius_map_units, center_pt.y())
+                            )
+                            circle_center = center_layer
+                            circle_radius = center_layer.distance(edge_layer)
+                            geom_for_layer = QgsGeometry.fromPointXY(center_layer).buffer(
+                                circle_radius, segments
+                            )
+                        else:
+                            # Different units (e.g. degrees vs metres): the circle
+                            # is distorted, so reproject the full polygon
+                            circle_center = None
+                            geom_for_layer = QgsGeometry(circle_geom)  # clone
+                            geom_for_layer.transform(xform)
+                    except Exception as e:
+                        QgsMessageLog.logMessage(
+                            f"CRS transform failed for layer {layer.name()}: {str(e)}", 
+                            "SelectOnHover", 
+                            Qgis.Warning
+                        )
+                        continue
+
+                bbox = geom_for_layer.boundingBox()
+                ids_to_process = set()
+
+                # Nothing to hit (and no index to build) outside the layer extent
+                if not bbox.intersects(layer.extent()):
+                    self._last_hover_ids[layer.id()] = frozenset()
                     continue
 
-            bbox = geom_for_layer.boundingBox()
-            ids_to_process = set()
+                # Prepare the circle once per layer so each candidate test reuses it
+                engine = QgsGeometry.createGeometryEngine(geom_for_layer.constGet())
+                engine.prepareGeometry()
 
-            # Use spatial index if available
-            index = self.layer_indexes.get(layer.id(), None)
-            if index:
-                try:
-                    candidate_ids = index.intersects(bbox)
-                except Exception:
-                    candidate_ids = []
-                
-                # Verify exact intersection for candidates
-                for fid in candidate_ids:
+                # Use spatial index if available, building it on first hover
+                index = self._ensure_index(layer)
+                if index:
                     try:
-                        feat = layer.getFeature(int(fid))
-                        g = feat.geometry()
-                        if g is None:
+                        candidate_ids = index.intersects(bbox)
+                    except Exception:
+                        candidate_ids = []
+
+                    # Vectorized bbox-to-circle distance test before the exact check
+                    if circle_center is not None:
+                        candidate_ids = self._cull_candidates(
+                            layer.id(), candidate_ids,
+                            circle_center.x(), circle_center.y(), circle_radius
+                        )
+                
+                    # Verify exact intersection against geometries stored in the index,
+                    # so candidates never have to be fetched from the provider
+                    for fid in candidate_ids:
+                        try:
+                            g = index.geometry(fid)
+                            if g is None or g.isNull():
+                                continue
+                            if engine.intersects(g.constGet()):
+                                ids_to_process.add(fid)
+                        except Exception:
                             continue
-                        if g.intersects(geom_for_layer):
-                            ids_to_process.add(feat.id())
+                else:
+                    # Fallback: exact rect filter done by the provider, then the
+                    # precise circle test; ExactIntersect only checks against bbox
+                    request = (
+                        QgsFeatureRequest()
+                        .setFilterRect(bbox)
+                        .setFlags(QgsFeatureRequest.ExactIntersect)
+                        .setNoAttributes()
+                    )
+                    try:
+                        for feat in layer.getFeatures(request):
+                            g = feat.geometry()
+                            if g is None or g.isNull():
+                                continue
+                            if engine.intersects(g.constGet()):
+                                ids_to_process.add(feat.id())
                     except Exception:
                         continue
-            else:
-                # Fallback: bbox filter + precise test
-                request = QgsFeatureRequest().setFilterRect(bbox)
-                try:
-                    for feat in layer.getFeatures(request):
-                        g = feat.geometry()
-                        if g is None:
-                            continue
-                        if g.intersects(geom_for_layer):
-                            ids_to_process.add(feat.id())
-                except Exception:
+
+                # Skip selectByIds (and the repaint it triggers) if the hit set is unchanged
+                hover_ids = frozenset(ids_to_process)
+                if self._last_hover_ids.get(layer.id()) == hover_ids:
                     continue
+                self._last_hover_ids[layer.id()] = hover_ids
+                self._watch_selection(layer)
 
-            if ids_to_process:
-                try:
-                    current_sel = set(layer.selectedFeatureIds())
-                    
-                    # Apply selection mode
-                    if self.selection_mode == "add":
-                        # Union: add to existing selection
-                        new_sel = list(current_sel.union(ids_to_process))
-                    elif self.selection_mode == "replace":
-                        # Replace: use only new selection
-                        new_sel = list(ids_to_process)
-                    elif self.selection_mode == "toggle":
-                        # Toggle: XOR
-                        new_sel = list(current_sel.symmetric_difference(ids_to_process))
-                    else:
-                        new_sel = list(current_sel.union(ids_to_process))
+                if ids_to_process:
+                    try:
+                        new_sel = self._combine_selection(
+                            layer.selectedFeatureIds(), ids_to_process
+                        )
                     
-                    layer.selectByIds(new_sel)
-                    total_selected += len(ids_to_process)
-                except Exception as e:
-                    QgsMessageLog.logMessage(
-                        f"Selection failed for layer {layer.name()}: {str(e)}", 
-                        "SelectOnHover", 
-                        Qgis.Warning
-                    )
+                        self._applying_selection = True
+                        try:
+                            layer.selectByIds(new_sel)
+                        finally:
+                            self._applying_selection = False
+                        selection_changed = True
+                        total_selected += len(ids_to_process)
+                    except Exception as e:
+                        QgsMessageLog.logMessage(
+                            f"Selection failed for layer {layer.name()}: {str(e)}", 
+                            "SelectOnHover", 
+                            Qgis.Warning
+                        )
+        finally:
+            self.canvas.freeze(was_frozen)
+        if selection_changed and not was_frozen:
+            self.canvas.refresh()
 
         # Show feedback in status bar
         if total_selected > 0:
@@ -406,8 +827,14 @@ class MapToolSelectCircle(QgsMapTool):
         """Called when tool becomes inactive"""
         super().deactivate()
         self.rubber_band.reset()
+        self._rubber_anchor = None
         self.rubber_band.hide()
         self._hover_timer.stop()
+        self._extents_timer.stop()
+        self._last_hover_ids.clear()
+        for layer_id in list(self._selection_connections):
+            self._unwatch_selection(layer_id)
+        self._last_processed_pos = None
 
     def cleanup(self):
         """Clean up resources"""
@@ -415,13 +842,28 @@ class MapToolSelectCircle(QgsMapTool):
             self.canvas.extentsChanged.disconnect(self._on_canvas_extents_changed)
         except Exception:
             pass
+
+        for layer_id in list(self._layer_connections):
+            self._disconnect_layer_signals(layer_id)
+        for layer_id in list(self._selection_connections):
+            self._unwatch_selection(layer_id)
         
         try:
             project = QgsProject.instance()
-            project.layersAdded.disconnect(self._on_layers_changed)
-            project.layersRemoved.disconnect(self._on_layers_changed)
+            project.crsChanged.disconnect(self._on_project_crs_changed)
+        except Exception:
+            pass
+
+        try:
+            root = QgsProject.instance().layerTreeRoot()
+            root.visibilityChanged.disconnect(self._invalidate_layer_list)
+            root.addedChildren.disconnect(self._invalidate_layer_list)
+            root.removedChildren.disconnect(self._invalidate_layer_list)
+            self.canvas.currentLayerChanged.disconnect(self._invalidate_layer_list)
         except Exception:
             pass
         
         self.rubber_band.reset()
+        self._rubber_anchor = None
         self._hover_timer.stop()
+        self._extents_timer.stop()
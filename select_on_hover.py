@@ -1,15 +1,43 @@
 import os
 from qgis.PyQt.QtWidgets import QAction, QToolButton, QMenu, QWidgetAction
 from qgis.PyQt.QtGui import QIcon
-from qgis.PyQt.QtCore import Qt, QSettings
+from qgis.PyQt.QtCore import Qt, QSettings, QTimer
+from qgis.PyQt import sip
 
-from qgis.core import QgsProject, QgsMessageLog, Qgis
+from qgis.core import QgsApplication, QgsProject, QgsVectorLayer, QgsMessageLog, Qgis
 from qgis.gui import QgsMapCanvas
 
 from .map_tool_select_circle import MapToolSelectCircle
 from .dock_widget import SelectOnHoverPanel
 
 PLUGIN_SETTINGS_PREFIX = "SelectOnHover/"
+SETTINGS_FILE_NAME = "select_on_hover.ini"  # Plugin-private INI under the QGIS settings dir
+SETTINGS_SAVE_DELAY_MS = 250  # Coalescing window for writing panel changes to QSettings
+# Persisted settings and their defaults; the default's type is used for coercion
+SETTINGS_DEFAULTS = {
+    "pixel_radius": 20,
+    "mapunit_radius": 10.0,
+    "unit_mode": "pixels",
+    "restrict_mode": "visible",
+    "selection_mode": "add",
+    "show_rubber_band": True,
+}
+
+_ICON_UNRESOLVED = object()
+
+
+def _resolve_icon(plugin_dir):
+    """Return the preferred icon file name in plugin_dir (icon.svg, then icon.png) or None"""
+    try:
+        with os.scandir(plugin_dir) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        return None
+    if "icon.svg" in names:
+        return "icon.svg"
+    if "icon.png" in names:
+        return "icon.png"
+    return None
 
 
 class SelectOnHoverPlugin:
@@ -26,6 +54,9 @@ class SelectOnHoverPlugin:
     - Auto-rebuild indexes on layer changes
     """
 
+    # Icon file name, resolved with one directory scan on first initGui
+    _icon_name = _ICON_UNRESOLVED
+
     def __init__(self, iface):
         """
         Initialize plugin.
@@ -39,19 +70,44 @@ class SelectOnHoverPlugin:
         self.toolbutton = None
         self.panel = None
         self.map_tool = None
+        self.canvas = None
         self.previous_map_tool = None
-        self.settings = QSettings()
+        self._last_applied = None  # panel values last pushed to the map tool on activation
+        # Plugin-private INI file instead of the platform default (registry on Windows)
+        self.settings = QSettings(
+            os.path.join(QgsApplication.qgisSettingsDirPath(), SETTINGS_FILE_NAME),
+            QSettings.IniFormat,
+        )
+        self._settings_cache = {}  # key (without prefix) -> stored value, already type-coerced
+        self._save_timer = None
+        # Informational logging, enabled with the SOH_VERBOSE=1 environment variable
+        self._verbose = os.environ.get("SOH_VERBOSE", "").strip() not in ("", "0")
 
     def initGui(self):
         """Initialize GUI elements"""
+        self.canvas = self.iface.mapCanvas()
+
+        # Bind slot methods once so every connect (and later disconnect) uses the same callable
+        self._on_toggled = self.toggle_activation
+        self._on_radius = self.onRadiusChanged
+        self._on_options = self.onOptionsChanged
+        self._on_visual_feedback = self.onVisualFeedbackChanged
+        self._on_rebuild_indexes = self.onRebuildIndexesRequested
+        self._on_clear_selection = self.onClearSelectionRequested
+
+        # Debounced settings writes: bursts of panel changes flush once
+        self._save_timer = QTimer(self.iface.mainWindow())
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._flush_settings)
+
         # Load icon - try SVG first (best for QGIS), then fallback to PNG
-        icon_svg_path = os.path.join(self.plugin_dir, "icon.svg")
-        icon_png_path = os.path.join(self.plugin_dir, "icon.png")
+        if SelectOnHoverPlugin._icon_name is _ICON_UNRESOLVED:
+            SelectOnHoverPlugin._icon_name = _resolve_icon(self.plugin_dir)
+        icon_name = SelectOnHoverPlugin._icon_name
         
-        if os.path.exists(icon_svg_path):
-            icon = QIcon(icon_svg_path)
-        elif os.path.exists(icon_png_path):
-            icon = QIcon(icon_png_path)
+        if icon_name:
+            icon = QIcon(os.path.join(self.plugin_dir, icon_name))
         else:
             # Fallback to default QGIS icon if our icon is missing
             icon = QIcon()
@@ -71,25 +127,11 @@ class SelectOnHoverPlugin:
         self.toolbutton.setIcon(icon)
         self.toolbutton.setToolTip("Select on hover - click to activate/deactivate, arrow for options")
         self.toolbutton.setCheckable(True)
-        self.toolbutton.toggled.connect(self.toggle_activation)
+        self.toolbutton.toggled.connect(self._on_toggled)
 
-        # Build popup menu with control panel
+        # Bare popup menu; the control panel is built the first time it opens
         menu = QMenu(self.toolbutton)
-        widget_action = QWidgetAction(menu)
-        self.panel = SelectOnHoverPanel()
-        
-        # Load saved settings
-        self._load_settings_from_panel()
-        
-        # Connect panel signals
-        self.panel.radiusChanged.connect(self.onRadiusChanged)
-        self.panel.optionsChanged.connect(self.onOptionsChanged)
-        self.panel.visualFeedbackChanged.connect(self.onVisualFeedbackChanged)
-        self.panel.rebuildIndexesRequested.connect(self.onRebuildIndexesRequested)
-        self.panel.clearSelectionRequested.connect(self.onClearSelectionRequested)
-        
-        widget_action.setDefaultWidget(self.panel)
-        menu.addAction(widget_action)
+        menu.aboutToShow.connect(self._build_menu_once)
 
         # Attach menu to button
         self.toolbutton.setMenu(menu)
@@ -98,31 +140,36 @@ class SelectOnHoverPlugin:
         # Add to toolbar
         self.iface.addToolBarWidget(self.toolbutton)
 
-        # Create map tool
-        canvas = self.iface.mapCanvas()
-        self.map_tool = MapToolSelectCircle(
-            canvas,
-            radius_pixels=self.panel.pixel_radius,
-            radius_map_units=self.panel.mapunit_radius,
-            unit_mode=self.panel.unit_mode,
-            restrict_mode=self.panel.restrict_mode,
-            selection_mode=self.panel.selection_mode,
-            show_rubber_band=self.panel.show_rubber_band,
-        )
-        
-        # Build initial indexes
-        self.map_tool.rebuildIndexes()
+        # Keep map tool indexes in step with project layer changes
+        project = QgsProject.instance()
+        project.layersAdded.connect(self._on_layers_added)
+        project.layersRemoved.connect(self._on_layers_removed)
 
-        QgsMessageLog.logMessage(
-            "SelectOnHover plugin initialized successfully", 
-            "SelectOnHover", 
-            Qgis.Info
-        )
+        if self._verbose:
+            QgsMessageLog.logMessage(
+                "SelectOnHover plugin initialized successfully", 
+                "SelectOnHover", 
+                Qgis.Info
+            )
 
     def unload(self):
         """Clean up plugin resources"""
-        # Save settings
-        self._save_settings_from_panel()
+        try:
+            project = QgsProject.instance()
+            project.layersAdded.disconnect(self._on_layers_added)
+            project.layersRemoved.disconnect(self._on_layers_removed)
+        except Exception:
+            pass
+
+        # Save settings now rather than waiting for the debounce timer, then
+        # write the batched changes to the backing store in a single sync
+        if self._save_timer:
+            self._save_timer.stop()
+        self._flush_settings()
+        self.settings.sync()
+        # The timer is parented to the main window, so delete it explicitly
+        if self._save_timer:
+            self._save_timer.deleteLater()
 
         # Remove menu action
         try:
@@ -144,15 +191,80 @@ class SelectOnHoverPlugin:
         if self.map_tool:
             self.map_tool.cleanup()
 
+        # Disconnect panel signals so nothing reaches the plugin during teardown
+        if self.panel:
+            for signal, slot in (
+                (self.panel.radiusChanged, self._on_radius),
+                (self.panel.optionsChanged, self._on_options),
+                (self.panel.visualFeedbackChanged, self._on_visual_feedback),
+                (self.panel.rebuildIndexesRequested, self._on_rebuild_indexes),
+                (self.panel.clearSelectionRequested, self._on_clear_selection),
+            ):
+                try:
+                    signal.disconnect(slot)
+                except Exception:
+                    pass
+
         self.menu_action = None
         self.toolbutton = None
         self.panel = None
         self.map_tool = None
+        self.previous_map_tool = None
+        self._last_applied = None
+        self._save_timer = None
+
+        if self._verbose:
+            QgsMessageLog.logMessage(
+                "SelectOnHover plugin unloaded", 
+                "SelectOnHover", 
+                Qgis.Info
+            )
+
+    def _build_menu_once(self):
+        """
+        Build the control panel into the popup menu, on first popup or when
+        the map tool first needs the panel values, instead of at QGIS startup.
+        """
+        if self.panel is not None:
+            return
+        menu = self.toolbutton.menu()
+        try:
+            menu.aboutToShow.disconnect(self._build_menu_once)
+        except Exception:
+            pass
 
-        QgsMessageLog.logMessage(
-            "SelectOnHover plugin unloaded", 
-            "SelectOnHover", 
-            Qgis.Info
+        widget_action = QWidgetAction(menu)
+        self.panel = SelectOnHoverPanel()
+        
+        # Load saved settings
+        self._load_settings_from_panel()
+        
+        # Connect panel signals
+        self.panel.radiusChanged.connect(self._on_radius)
+        self.panel.optionsChanged.connect(self._on_options)
+        self.panel.visualFeedbackChanged.connect(self._on_visual_feedback)
+        self.panel.rebuildIndexesRequested.connect(self._on_rebuild_indexes)
+        self.panel.clearSelectionRequested.connect(self._on_clear_selection)
+        
+        widget_action.setDefaultWidget(self.panel)
+        menu.addAction(widget_action)
+
+    def _ensure_initialized(self):
+        """Create the control panel and map tool on first activation"""
+        self._build_menu_once()
+        if self.map_tool is not None:
+            return
+
+        # Create map tool; indexes are built lazily on first hover
+        self.map_tool = MapToolSelectCircle(
+            self.canvas,
+            radius_pixels=self.panel.pixel_radius,
+            radius_map_units=self.panel.mapunit_radius,
+            unit_mode=self.panel.unit_mode,
+            restrict_mode=self.panel.restrict_mode,
+            selection_mode=self.panel.selection_mode,
+            show_rubber_band=self.panel.show_rubber_band,
+            debug=self._verbose,
         )
 
     def _toggle_toolbutton_from_menu(self):
@@ -167,45 +279,72 @@ class SelectOnHoverPlugin:
         Args:
             active: True to activate, False to deactivate
         """
-        canvas = self.iface.mapCanvas()
+        canvas = self.canvas
+        self._ensure_initialized()
         
         if active:
             # Save previous tool
             self.previous_map_tool = canvas.mapTool()
             
-            # Update map tool settings
-            self.map_tool.setRadius(
-                self.panel.pixel_radius, 
-                self.panel.mapunit_radius, 
-                self.panel.unit_mode
+            # Update map tool settings, unless already applied with the same values
+            snapshot = (
+                self.panel.pixel_radius,
+                self.panel.mapunit_radius,
+                self.panel.unit_mode,
+                self.panel.restrict_mode,
+                self.panel.selection_mode,
+                self.panel.show_rubber_band,
             )
-            self.map_tool.setRestrictMode(self.panel.restrict_mode)
-            self.map_tool.setSelectionMode(self.panel.selection_mode)
-            self.map_tool.setShowRubberBand(self.panel.show_rubber_band)
-            
-            # Rebuild indexes
-            self.map_tool.rebuildIndexes()
+            if snapshot != self._last_applied:
+                self.map_tool.setRadius(
+                    self.panel.pixel_radius, 
+                    self.panel.mapunit_radius, 
+                    self.panel.unit_mode
+                )
+                self.map_tool.setRestrictMode(self.panel.restrict_mode)
+                self.map_tool.setSelectionMode(self.panel.selection_mode)
+                self.map_tool.setShowRubberBand(self.panel.show_rubber_band)
+                self._last_applied = snapshot
             
             # Activate tool
             canvas.setMapTool(self.map_tool)
             
-            QgsMessageLog.logMessage(
-                "Select on hover tool activated", 
-                "SelectOnHover", 
-                Qgis.Info
-            )
+            if self._verbose:
+                QgsMessageLog.logMessage(
+                    "Select on hover tool activated", 
+                    "SelectOnHover", 
+                    Qgis.Info
+                )
         else:
-            # Restore previous tool
-            if self.previous_map_tool:
-                canvas.setMapTool(self.previous_map_tool)
+            # Restore previous tool unless its C++ object was destroyed meanwhile;
+            # drop our reference either way so a disposed tool is not kept alive
+            previous = self.previous_map_tool
+            self.previous_map_tool = None
+            if previous is not None and not sip.isdeleted(previous):
+                canvas.setMapTool(previous)
             else:
                 canvas.unsetMapTool(self.map_tool)
             
-            QgsMessageLog.logMessage(
-                "Select on hover tool deactivated", 
-                "SelectOnHover", 
-                Qgis.Info
-            )
+            if self._verbose:
+                QgsMessageLog.logMessage(
+                    "Select on hover tool deactivated", 
+                    "SelectOnHover", 
+                    Qgis.Info
+                )
+
+    def _on_layers_added(self, layers):
+        """Register added layers with the map tool"""
+        if self.map_tool is None:
+            return
+        for layer in layers:
+            self.map_tool.addLayerIndex(layer)
+
+    def _on_layers_removed(self, layer_ids):
+        """Drop removed layers' indexes"""
+        if self.map_tool is None:
+            return
+        for layer_id in layer_ids:
+            self.map_tool.removeLayerIndex(layer_id)
 
     def onRadiusChanged(self, pixel_radius: int, mapunit_radius: float, unit_mode: str):
         """Handle radius changes from control panel"""
@@ -216,10 +355,7 @@ class SelectOnHoverPlugin:
     def onOptionsChanged(self, restrict_mode: str, selection_mode: str):
         """Handle option changes from control panel"""
         if self.map_tool:
-            self.map_tool.setRestrictMode(restrict_mode)
-            self.map_tool.setSelectionMode(selection_mode)
-            # Rebuild indexes to reflect new restriction
-            self.map_tool.rebuildIndexes()
+            self.map_tool.setOptions(restrict_mode, selection_mode)
         self._save_settings_from_panel()
 
     def onVisualFeedbackChanged(self, show_rubber_band: bool):
@@ -231,18 +367,19 @@ class SelectOnHoverPlugin:
     def onRebuildIndexesRequested(self):
         """Handle manual index rebuild request"""
         if self.map_tool:
-            QgsMessageLog.logMessage(
-                "Manually rebuilding spatial indexes...", 
-                "SelectOnHover", 
-                Qgis.Info
-            )
+            if self._verbose:
+                QgsMessageLog.logMessage(
+                    "Manually clearing spatial indexes...", 
+                    "SelectOnHover", 
+                    Qgis.Info
+                )
             self.map_tool.rebuildIndexes()
             
             # Show feedback
             try:
                 self.iface.messageBar().pushMessage(
                     "SelectOnHover", 
-                    "Spatial indexes rebuilt successfully", 
+                    "Spatial indexes cleared; they will be rebuilt on hover", 
                     level=Qgis.Info, 
                     duration=3
                 )
@@ -253,12 +390,14 @@ class SelectOnHoverPlugin:
         """Handle clear selection request"""
         count = 0
         for layer in QgsProject.instance().mapLayers().values():
+            # Only vector layers carry a feature selection
+            if not isinstance(layer, QgsVectorLayer):
+                continue
             try:
-                if hasattr(layer, 'removeSelection'):
-                    selected_count = layer.selectedFeatureCount()
-                    if selected_count > 0:
-                        count += selected_count
-                        layer.removeSelection()
+                selected_count = layer.selectedFeatureCount()
+                if selected_count > 0:
+                    count += selected_count
+                    layer.removeSelection()
             except Exception:
                 pass
         
@@ -274,40 +413,72 @@ class SelectOnHoverPlugin:
             except Exception:
                 pass
             
-            QgsMessageLog.logMessage(
-                f"Cleared selection: {count} features", 
-                "SelectOnHover", 
-                Qgis.Info
-            )
+            if self._verbose:
+                QgsMessageLog.logMessage(
+                    f"Cleared selection: {count} features", 
+                    "SelectOnHover", 
+                    Qgis.Info
+                )
 
     def _load_settings_from_panel(self):
         """Load settings from QSettings and apply to panel"""
-        # Default values
-        pixel_radius = int(self.settings.value(PLUGIN_SETTINGS_PREFIX + "pixel_radius", 20))
-        mapunit_radius = float(self.settings.value(PLUGIN_SETTINGS_PREFIX + "mapunit_radius", 10.0))
-        unit_mode = str(self.settings.value(PLUGIN_SETTINGS_PREFIX + "unit_mode", "pixels"))
-        restrict_mode = str(self.settings.value(PLUGIN_SETTINGS_PREFIX + "restrict_mode", "visible"))
-        selection_mode = str(self.settings.value(PLUGIN_SETTINGS_PREFIX + "selection_mode", "add"))
-        show_rubber_band = self.settings.value(PLUGIN_SETTINGS_PREFIX + "show_rubber_band", True, type=bool)
+        # Read the whole group once; later loads are served from memory
+        if not self._settings_cache:
+            self._settings_cache.update(self._read_settings_group(self.settings))
+
+            # Migrate values saved by earlier versions in the default QSettings store
+            if not self._settings_cache:
+                legacy = self._read_settings_group(QSettings())
+                for key, value in legacy.items():
+                    self.settings.setValue(PLUGIN_SETTINGS_PREFIX + key, value)
+                self._settings_cache.update(legacy)
 
         if self.panel:
-            self.panel.setValues(
-                pixel_radius=pixel_radius,
-                mapunit_radius=mapunit_radius,
-                unit_mode=unit_mode,
-                restrict_mode=restrict_mode,
-                selection_mode=selection_mode,
-                show_rubber_band=show_rubber_band,
-            )
+            self.panel.setValues(**{key: self._cached_setting(key) for key in SETTINGS_DEFAULTS})
+
+    @staticmethod
+    def _read_settings_group(settings) -> dict:
+        """
+        Read the plugin's known settings in one pass. Only keys present in the
+        store are read, without a default, and PyQt converts each value to its
+        default's type; missing or unconvertible keys fall back to SETTINGS_DEFAULTS.
+        """
+        values = {}
+        settings.beginGroup(PLUGIN_SETTINGS_PREFIX.rstrip("/"))
+        try:
+            stored_keys = set(settings.childKeys())
+            for key, default in SETTINGS_DEFAULTS.items():
+                if key in stored_keys:
+                    try:
+                        values[key] = settings.value(key, type=type(default))
+                    except TypeError:
+                        continue
+        finally:
+            settings.endGroup()
+        return values
+
+    def _cached_setting(self, key: str):
+        """Return a cached (already typed) setting, or its default"""
+        value = self._settings_cache.get(key)
+        if value is None:
+            return SETTINGS_DEFAULTS[key]
+        return value
 
     def _save_settings_from_panel(self):
-        """Save current panel values to QSettings"""
+        """Schedule saving current panel values to QSettings"""
+        if self._save_timer:
+            self._save_timer.start()
+        else:
+            self._flush_settings()
+
+    def _flush_settings(self):
+        """Write panel values that differ from the last persisted ones to QSettings"""
         if not self.panel:
             return
         
-        self.settings.setValue(PLUGIN_SETTINGS_PREFIX + "pixel_radius", self.panel.pixel_radius)
-        self.settings.setValue(PLUGIN_SETTINGS_PREFIX + "mapunit_radius", self.panel.mapunit_radius)
-        self.settings.setValue(PLUGIN_SETTINGS_PREFIX + "unit_mode", self.panel.unit_mode)
-        self.settings.setValue(PLUGIN_SETTINGS_PREFIX + "restrict_mode", self.panel.restrict_mode)
-        self.settings.setValue(PLUGIN_SETTINGS_PREFIX + "selection_mode", self.panel.selection_mode)
-        self.settings.setValue(PLUGIN_SETTINGS_PREFIX + "show_rubber_band", self.panel.show_rubber_band)
+        for key in SETTINGS_DEFAULTS:
+            value = getattr(self.panel, key)
+            if key in self._settings_cache and self._cached_setting(key) == value:
+                continue
+            self.settings.setValue(PLUGIN_SETTINGS_PREFIX + key, value)
+            self._settings_cache[key] = value